@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the pricing kernel into strategy/_pricing_kernel_aot
+
+The compiled extension is picked up by strategy._pricing_kernel at import, which
+skips JIT compilation at startup. Without it the kernel falls back to numba's JIT
+or plain Python.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from strategy._pricing_kernel import _compute_quotes
+
+SIGNATURE = "Tuple((f8, i8, i8))(f8, f8, f8, f8, f8, f8)"
+
+
+def main():
+    cc = CC("_pricing_kernel_aot")
+    cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy")
+    cc.export("compute_quotes", SIGNATURE)(_compute_quotes)
+    cc.compile()
+    print(f"Built pricing kernel in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
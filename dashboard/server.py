@@ -4,17 +4,16 @@ Provides web interface for monitoring trading activity
 """
 
 import asyncio
-import http.server
-import json
+import errno
+import functools
 import os
-import socketserver
-import sys
-import threading
 import time
 import webbrowser
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse, parse_qs
+from typing import Callable, Dict, Optional, Tuple
+
+import orjson
+from aiohttp import web
 
 import settings
 from logging_config import get_logger
@@ -22,241 +21,275 @@ from logging_config import get_logger
 logger = get_logger("dashboard")
 
 
-class DashboardRequestHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler with CORS support and REST API endpoints"""
-    
-    def __init__(self, *args, static_dir: str = None, market_maker=None, **kwargs):
-        self.static_dir = static_dir or str(Path(__file__).parent / "static")
+@functools.lru_cache(maxsize=None)
+def _error_body(message: str) -> bytes:
+    """Encode an error payload once per distinct message"""
+    return orjson.dumps({"error": message})
+
+
+def _error_response(message: str, status: int) -> web.Response:
+    """Build a JSON error response from a pre-encoded body"""
+    return _body_response(_error_body(message), status)
+
+
+def _body_response(body: bytes, status: int = 200) -> web.Response:
+    """Build a JSON response from an already encoded body, no further encoding happens"""
+    return web.Response(body=body, status=status, content_type='application/json')
+
+
+@web.middleware
+async def headers_middleware(request: web.Request, handler) -> web.StreamResponse:
+    """Add CORS/no-store headers to API responses and revalidation headers to everything else"""
+    if request.path.startswith('/api/'):
+        if request.method == 'OPTIONS':
+            response = web.Response()
+        else:
+            response = await handler(request)
+
+        response.headers['Access-Control-Allow-Origin'] = '*'
+        response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+        response.headers['Access-Control-Allow-Headers'] = '*'
+        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+        response.headers['Pragma'] = 'no-cache'
+        response.headers['Expires'] = '0'
+        return response
+
+    response = await handler(request)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+class DashboardServer:
+    """Dashboard HTTP server running on the application's event loop"""
+
+    def __init__(self, host: str = "localhost", port: int = 8000, market_maker=None):
+        self.host = host
+        self.port = port
         self.market_maker = market_maker
-        super().__init__(*args, directory=self.static_dir, **kwargs)
-    
-    def end_headers(self):
-        """Add CORS headers for local development"""
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', '*')
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
-        super().end_headers()
-
-    def do_OPTIONS(self):
-        """Handle preflight OPTIONS requests"""
-        self.send_response(200)
-        self.end_headers()
-
-    def do_GET(self):
-        """Handle GET requests with API endpoints and static file serving"""
-        parsed_url = urlparse(self.path)
-        path = parsed_url.path
-        
-        if path.startswith('/api/'):
-            return self._handle_api_request(path)
-        
-        if path == '/' or path == '':
-            self.path = '/index.html'
-        
-
-        
-        return super().do_GET()
-    
-    def _handle_api_request(self, path: str):
-        """Handle REST API requests"""
-        try:
-            if not self.market_maker:
-                self._send_json_response({"error": "MarketMaker not available"}, 503)
-                return
-            
-            if path == '/api/status':
-                self._handle_status_api()
-            elif path == '/api/quotes':
-                self._handle_quotes_api()
-            elif path == '/api/orders':
-                self._handle_orders_api()
-            elif path == '/api/position':
-                self._handle_position_api()
-            else:
-                self._send_json_response({"error": "API endpoint not found"}, 404)
-                
-        except Exception as e:
-            logger.error(f"API request error: {e}")
-            self._send_json_response({"error": "Internal server error"}, 500)
-    
-    def _handle_status_api(self):
+        self.runner: Optional[web.AppRunner] = None
+        self.is_running = False
+        self.static_dir = str(Path(__file__).parent / "static")
+        self.index_path = Path(self.static_dir) / "index.html"
+
+        # Encoded API payloads - path -> (expires_at, state_version, body)
+        self._cache: Dict[str, Tuple[float, int, bytes]] = {}
+        self.cache_ttl = settings.DASHBOARD_CACHE_TTL
+
+    def _create_app(self) -> web.Application:
+        """Create the aiohttp application with API routes and static file serving"""
+        app = web.Application(middlewares=[headers_middleware])
+        app.router.add_get('/api/status', self._handle_status_api)
+        app.router.add_get('/api/quotes', self._handle_quotes_api)
+        app.router.add_get('/api/orders', self._handle_orders_api)
+        app.router.add_get('/api/position', self._handle_position_api)
+        app.router.add_route('*', '/api/{tail:.*}', self._handle_unknown_api)
+        app.router.add_get('/', self._handle_index)
+        app.router.add_get('/index.html', self._handle_index)
+        app.router.add_static('/static', self.static_dir)
+        return app
+
+    # ===== RESPONSE CACHE =====
+
+    def _cached_response(self, path: str, build_payload: Callable[[], Optional[dict]]) -> Optional[web.Response]:
+        """
+        Serve an API payload from cache, rebuilding it when expired or stale.
+
+        Entries expire after cache_ttl seconds or as soon as the market maker
+        reports a state change, so concurrent polls share one encoded body.
+
+        Returns:
+            Response with the encoded payload, or None if build_payload had no data
+        """
+        now = time.monotonic()
+        version = self.market_maker.state_version
+
+        entry = self._cache.get(path)
+        if entry and entry[0] > now and entry[1] == version:
+            return _body_response(entry[2])
+
+        payload = build_payload()
+        if payload is None:
+            return None
+
+        body = orjson.dumps(payload)
+        self._cache[path] = (now + self.cache_ttl, version, body)
+        return _body_response(body)
+
+    # ===== API HANDLERS =====
+
+    async def _handle_index(self, request: web.Request) -> web.StreamResponse:
+        """Serve the dashboard page via sendfile"""
+        return web.FileResponse(self.index_path)
+
+    async def _handle_unknown_api(self, request: web.Request) -> web.Response:
+        """Fallback for API paths without a handler"""
+        return _error_response("API endpoint not found", 404)
+
+    async def _handle_status_api(self, request: web.Request) -> web.Response:
         """API endpoint for overall bot status"""
+        if not self.market_maker:
+            return _error_response("MarketMaker not available", 503)
+
         try:
-            uptime = time.time() - self.market_maker.start_time
-            
-            fair_price = None
-            if self.market_maker.pricing_calculator:
-                fair_price = self.market_maker.pricing_calculator.get_fair_price()
-            
-            status_data = {
-                "status": "running",
-                "uptime": uptime,
-                "fair_price": fair_price,
-                "current_orders": self.market_maker.current_orders.copy(),
-                "last_updated": time.time()
-            }
-            
-            self._send_json_response(status_data)
-            
+            return self._cached_response(request.path, self._build_status)
+
         except Exception as e:
             logger.error(f"Status API error: {e}")
-            self._send_json_response({"error": "Failed to get status"}, 500)
-    
-    def _handle_quotes_api(self):
+            return _error_response("Failed to get status", 500)
+
+    async def _handle_quotes_api(self, request: web.Request) -> web.Response:
         """API endpoint for current quote data"""
+        if not self.market_maker:
+            return _error_response("MarketMaker not available", 503)
+
         try:
-            fair_price = self.market_maker.pricing_calculator.get_fair_price()
-            if not fair_price:
-                self._send_json_response({"error": "No fair price available"}, 503)
-                return
-            
-            bid_price, ask_price = self.market_maker.pricing_calculator.calculate_bid_ask_prices(fair_price)
-            
-            quote_data = {
-                "timestamp": time.time(),
-                "fair_price": fair_price,
-                "bid_price": bid_price,
-                "ask_price": ask_price,
-                "spread": ask_price - bid_price,
-                "spread_bps": ((ask_price - bid_price) / fair_price) * 10000,
-                "uptime": time.time() - self.market_maker.start_time,
-                "current_orders": self.market_maker.current_orders.copy()
-            }
-            
-            self._send_json_response(quote_data)
-            
+            response = self._cached_response(request.path, self._build_quotes)
+            if response is None:
+                return _error_response("No fair price available", 503)
+            return response
+
         except Exception as e:
             logger.error(f"Quotes API error: {e}")
-            self._send_json_response({"error": "Failed to get quotes"}, 500)
-    
-    def _handle_orders_api(self):
+            return _error_response("Failed to get quotes", 500)
+
+    async def _handle_orders_api(self, request: web.Request) -> web.Response:
         """API endpoint for current order state"""
+        if not self.market_maker:
+            return _error_response("MarketMaker not available", 503)
+
         try:
-            order_data = {
-                "timestamp": time.time(),
-                "active_orders": list(self.market_maker.account_state.get_active_orders().values()),
-                "recent_fills": list(self.market_maker.account_state.get_filled_orders().values())[-10:],
-                "order_summary": self.market_maker.account_state.get_order_summary(),
-                "current_order_ids": self.market_maker.current_orders.copy(),
-                "uptime": time.time() - self.market_maker.start_time
-            }
-            
-            self._send_json_response(order_data)
-            
+            return self._cached_response(request.path, self._build_orders)
+
         except Exception as e:
             logger.error(f"Orders API error: {e}")
-            self._send_json_response({"error": "Failed to get orders"}, 500)
-    
-    def _handle_position_api(self):
+            return _error_response("Failed to get orders", 500)
+
+    async def _handle_position_api(self, request: web.Request) -> web.Response:
         """API endpoint for current position data"""
+        if not self.market_maker:
+            return _error_response("MarketMaker not available", 503)
+
         try:
-            position_data = self.market_maker.current_position.copy()
-            position_data["last_updated"] = time.time()
-            
-            self._send_json_response(position_data)
-            
+            return self._cached_response(request.path, self._build_position)
+
         except Exception as e:
             logger.error(f"Position API error: {e}")
-            self._send_json_response({"error": "Failed to get position"}, 500)
-    
-    def _send_json_response(self, data: dict, status_code: int = 200):
-        """Send JSON response with proper headers"""
-        response_body = json.dumps(data, indent=2)
-        
-        self.send_response(status_code)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Content-Length', str(len(response_body)))
-        self.end_headers()
-        self.wfile.write(response_body.encode('utf-8'))
-
-    def log_message(self, format, *args):
-        """Suppress HTTP request logs for cleaner output"""
-        # Only log errors, not every request
-        if "GET" not in format or "200" not in format:
-            logger.debug(format % args)
+            return _error_response("Failed to get position", 500)
 
+    # ===== PAYLOAD BUILDERS =====
+    # Order and position data come from the market maker's published snapshot,
+    # which is never mutated after publication, so no copies are needed.
 
-class DashboardServer:
-    """Dashboard HTTP server with lifecycle management"""
-    
-    def __init__(self, host: str = "localhost", port: int = 8000, market_maker=None):
-        self.host = host
-        self.port = port
-        self.market_maker = market_maker
-        self.httpd: Optional[socketserver.TCPServer] = None
-        self.server_thread: Optional[threading.Thread] = None
-        self.is_running = False
-        self.static_dir = str(Path(__file__).parent / "static")
-        
-    def _create_handler(self):
-        """Create request handler with static directory and market maker configuration"""
-        static_dir = self.static_dir
-        market_maker = self.market_maker
-        
-        class ConfiguredHandler(DashboardRequestHandler):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, static_dir=static_dir, market_maker=market_maker, **kwargs)
-        return ConfiguredHandler
-    
-    def start(self) -> bool:
-        """Start the dashboard server in a background thread"""
+    def _build_status(self) -> dict:
+        """Build the overall bot status payload"""
+        now = time.time()
+
+        # NaN when there is no price data, orjson encodes it as null
+        fair_price = None
+        if self.market_maker.pricing_calculator:
+            fair_price = self.market_maker.pricing_calculator.get_fair_price()
+
+        return {
+            "status": "running",
+            "uptime": now - self.market_maker.start_time,
+            "fair_price": fair_price,
+            "current_orders": self.market_maker.snapshot.current_orders,
+            "last_updated": now
+        }
+
+    def _build_quotes(self) -> Optional[dict]:
+        """Build the current quote payload, None if no fair price is available"""
+        quotes = self.market_maker.pricing_calculator.get_quotes()
+        if quotes is None or not quotes[0]:
+            return None
+
+        fair_price, bid_price, ask_price = quotes
+        now = time.time()
+
+        return {
+            "timestamp": now,
+            "fair_price": fair_price,
+            "bid_price": bid_price,
+            "ask_price": ask_price,
+            "spread": ask_price - bid_price,
+            "spread_bps": ((ask_price - bid_price) / fair_price) * 10000,
+            "uptime": now - self.market_maker.start_time,
+            "current_orders": self.market_maker.snapshot.current_orders
+        }
+
+    def _build_orders(self) -> dict:
+        """Build the current order state payload"""
+        now = time.time()
+        account_state = self.market_maker.account_state
+
+        return {
+            "timestamp": now,
+            "active_orders": list(account_state.get_active_orders().values()),
+            "recent_fills": account_state.get_recent_fills(),
+            "order_summary": account_state.get_order_summary(),
+            "current_order_ids": self.market_maker.snapshot.current_orders,
+            "uptime": now - self.market_maker.start_time
+        }
+
+    def _build_position(self) -> dict:
+        """Build the current position payload"""
+        return {**self.market_maker.snapshot.current_position, "last_updated": time.time()}
+
+    # ===== LIFECYCLE =====
+
+    async def start(self) -> bool:
+        """Start the dashboard server on the running event loop"""
         if self.is_running:
             logger.warning("Dashboard server is already running")
             return True
-            
+
         try:
-            self.httpd = socketserver.TCPServer((self.host, self.port), self._create_handler())
-            
-            self.server_thread = threading.Thread(
-                target=self.httpd.serve_forever,
-                name="DashboardServer",
-                daemon=True
-            )
-            self.server_thread.start()
+            self.runner = web.AppRunner(self._create_app(), access_log=None)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, self.host, self.port)
+            await site.start()
             self.is_running = True
-            
+
             logger.info(f"Dashboard server started at http://{self.host}:{self.port}")
-            
+
             if settings.DASHBOARD_AUTO_OPEN:
                 try:
-                    webbrowser.open(f"http://{self.host}:{self.port}")
+                    # Launching the browser can block, keep it off the event loop
+                    await asyncio.to_thread(webbrowser.open, f"http://{self.host}:{self.port}")
                 except Exception as e:
                     logger.debug(f"Could not auto-open browser: {e}")
-            
+
             return True
-            
+
         except OSError as e:
-            if e.errno == 48:
+            await self._cleanup_runner()
+            if e.errno == errno.EADDRINUSE:
                 logger.error(f"Port {self.port} is already in use. Dashboard server not started.")
-                return False
             else:
                 logger.error(f"Failed to start dashboard server: {e}")
-                return False
+            return False
         except Exception as e:
+            await self._cleanup_runner()
             logger.error(f"Unexpected error starting dashboard server: {e}")
             return False
-    
-    def stop(self):
+
+    async def stop(self):
         """Stop the dashboard server"""
         if not self.is_running:
             return
-            
-        if self.httpd:
-            logger.info("Stopping dashboard server...")
-            self.httpd.shutdown()
-            self.httpd.server_close()
-            
-        if self.server_thread and self.server_thread.is_alive():
-            self.server_thread.join(timeout=5)
-            
+
+        logger.info("Stopping dashboard server...")
+        await self._cleanup_runner()
+
         self.is_running = False
         logger.info("Dashboard server stopped")
-    
 
-    
+    async def _cleanup_runner(self):
+        """Release the app runner and its listening sockets"""
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
     def get_status(self) -> dict:
         """Get server status information"""
         return {
@@ -272,7 +305,7 @@ class DashboardServer:
 async def start_dashboard_server(shutdown_event: Optional[asyncio.Event] = None, market_maker=None) -> None:
     """
     Start dashboard server as an async task
-    
+
     Args:
         shutdown_event: Optional event to monitor for shutdown signal
         market_maker: MarketMaker instance for direct data access
@@ -282,53 +315,54 @@ async def start_dashboard_server(shutdown_event: Optional[asyncio.Event] = None,
         port=settings.DASHBOARD_PORT,
         market_maker=market_maker
     )
-    
-    if not server.start():
+
+    if not await server.start():
         logger.error("Failed to start dashboard server")
         return
-    
-    if shutdown_event:
-        try:
+
+    try:
+        if shutdown_event:
             await shutdown_event.wait()
-        except asyncio.CancelledError:
-            pass
-        finally:
-            server.stop()
-    else:
-        try:
+        else:
             while server.is_running:
                 await asyncio.sleep(1)
-        except asyncio.CancelledError:
-            server.stop()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await server.stop()
 
 
 def run_standalone_dashboard():
     """Run dashboard server standalone (for testing or separate process)"""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Roxom Market Maker Dashboard")
     parser.add_argument("--host", default="localhost", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     args = parser.parse_args()
-    
+
     server = DashboardServer(args.host, args.port)
-    
+
     print(f"Starting Roxom Dashboard Server on {args.host}:{args.port}")
     print(f"Dashboard: http://{args.host}:{args.port}")
     print(f"Serving from: {os.getcwd()}")
     print("Press Ctrl+C to stop")
     print()
-    
-    try:
-        if server.start():
+
+    async def serve():
+        if not await server.start():
+            return
+        try:
             while server.is_running:
-                import time
-                time.sleep(1)
+                await asyncio.sleep(1)
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
     except KeyboardInterrupt:
         print("\nShutting down dashboard server...")
-    finally:
-        server.stop()
 
 
 if __name__ == "__main__":
-    run_standalone_dashboard()
\ No newline at end of file
+    run_standalone_dashboard()
@@ -3,17 +3,45 @@ Centralized logging configuration for Roxom Market Maker
 """
 
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 import settings
 
+# Background thread that owns the real handler, started by setup_logging
+_queue_listener = None
+
 
 def setup_logging():
-    """Configure logging for the entire application"""
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL),
-        format=settings.LOG_FORMAT,
-        filename=settings.LOG_FILE
-    )
+    """
+    Configure logging for the entire application.
+
+    Log calls only enqueue records; a QueueListener thread formats them and
+    performs the console/file I/O so the event loop never blocks on writes.
+    """
+    global _queue_listener
+
+    if settings.LOG_FILE:
+        handler = logging.FileHandler(settings.LOG_FILE)
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, settings.LOG_LEVEL))
+    root.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
+def shutdown_logging():
+    """Flush queued log records and stop the listener thread"""
+    global _queue_listener
+
+    if _queue_listener:
+        _queue_listener.stop()
+        _queue_listener = None
 
 def get_logger(module_name: str = None) -> logging.Logger:
     """
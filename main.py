@@ -7,7 +7,7 @@ import asyncio
 import signal
 
 import settings
-from logging_config import get_main_logger, setup_logging
+from logging_config import get_main_logger, setup_logging, shutdown_logging
 from strategy.market_maker import MarketMaker
 
 setup_logging()
@@ -25,6 +25,17 @@ def signal_handler(signum, frame):
         market_maker.trigger_shutdown()
 
 
+def install_uvloop():
+    """Run on uvloop's event loop when available, uvloop does not support Windows"""
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop not available, using the default asyncio event loop")
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 async def main():
     """Application entry point - start the market maker and dashboard"""
     global market_maker
@@ -55,4 +66,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    install_uvloop()
+    
+    try:
+        asyncio.run(main())
+    finally:
+        shutdown_logging()
\ No newline at end of file
@@ -1,7 +1,8 @@
 import asyncio
-import json
-from typing import Callable
+import random
+from typing import Callable, List, Set, Union
 
+import msgspec
 import websockets
 
 import settings
@@ -11,6 +12,18 @@ from .state import MarketDataState
 logger = get_binance_ws_logger()
 
 
+class BookTicker(msgspec.Struct):
+    """Binance bookTicker payload, only the fields used for pricing"""
+    s: str
+    b: float
+    a: float
+
+
+class CombinedStreamMessage(msgspec.Struct):
+    """Combined-stream envelope wrapping a bookTicker payload"""
+    data: BookTicker
+
+
 class BinanceWebSocketClient:
     """Handles Binance WebSocket connections and price updates"""
 
@@ -20,6 +33,17 @@ class BinanceWebSocketClient:
         self.shutdown_event = shutdown_event
         self.ws_url = settings.BINANCE_WS_URL
         self.symbols = settings.PRICE_SYMBOLS
+        self._symbols_upper = frozenset(symbol.upper() for symbol in self.symbols)
+        self._subscribe_frame = msgspec.json.encode({
+            "method": "SUBSCRIBE",
+            "params": [f"{symbol}@bookTicker" for symbol in self.symbols],
+            "id": 1
+        }).decode()
+        self._reconnect_backoff = settings.BINANCE_RECONNECT_MIN_DELAY
+        
+        # Binance sends prices as strings, strict=False lets msgspec coerce them to float
+        self._ticker_decoder = msgspec.json.Decoder(BookTicker, strict=False)
+        self._combined_decoder = msgspec.json.Decoder(CombinedStreamMessage, strict=False)
     
     async def start(self):
         """Start the WebSocket connection"""
@@ -30,47 +54,121 @@ class BinanceWebSocketClient:
                 if self.shutdown_event and self.shutdown_event.is_set():
                     logger.info("Shutdown requested, stopping WebSocket client")
                     break
-                logger.error(f"Connection error: {e}. Reconnecting in 5 seconds")
-                await asyncio.sleep(5)
+                delay = self._next_reconnect_delay()
+                logger.error(f"Connection error: {e}. Reconnecting in {delay:.2f} seconds")
+                await asyncio.sleep(delay)
+    
+    def _next_reconnect_delay(self) -> float:
+        """Exponential backoff with jitter between reconnection attempts"""
+        backoff = self._reconnect_backoff
+        self._reconnect_backoff = min(backoff * 2, settings.BINANCE_RECONNECT_MAX_DELAY)
+        return backoff / 2 + random.uniform(0, backoff / 2)
     
     async def _connect_and_listen(self):
-        """Connect to Binance WebSocket and listen for price updates"""
-        streams = "/".join(f"{symbol}@bookTicker" for symbol in self.symbols)
-        ws_url = f"{self.ws_url}/{streams}"
+        """Connect to Binance WebSocket, subscribe and listen for price updates"""
+        logger.info(f"Connecting to: {self.ws_url}")
         
-        logger.info(f"Connecting to: {ws_url}")
-        
-        async with websockets.connect(ws_url) as ws:
+        async with websockets.connect(
+            self.ws_url,
+            ping_interval=settings.BINANCE_PING_INTERVAL,
+            ping_timeout=settings.BINANCE_PING_INTERVAL,
+            max_queue=None,
+            # bookTicker frames are ~150 bytes: skip permessage-deflate and cap frame size
+            compression=None,
+            max_size=2 ** 16
+        ) as ws:
             logger.info("Connected to Binance WebSocket")
             
-            while not (self.shutdown_event and self.shutdown_event.is_set()):
-                try:
-                    msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                    data = json.loads(msg)
-                    await self._handle_message(data)
+            await ws.send(self._subscribe_frame)
+            self._reconnect_backoff = settings.BINANCE_RECONNECT_MIN_DELAY
+            
+            # Closing the socket on shutdown ends the read loop below
+            shutdown_watcher = None
+            if self.shutdown_event:
+                shutdown_watcher = asyncio.create_task(self._close_on_shutdown(ws))
+            
+            queue: asyncio.Queue = asyncio.Queue()
+            reader = asyncio.create_task(self._read_frames(ws, queue))
+            
+            try:
+                closed = False
+                while not closed:
+                    # Drain every frame that arrived since the last pass
+                    batch = [await queue.get()]
+                    while not queue.empty():
+                        batch.append(queue.get_nowait())
+                    
+                    if batch[-1] is None:
+                        closed = True
+                        batch.pop()
                     
-                except asyncio.TimeoutError:
-                    continue
-                except websockets.ConnectionClosed:
-                    logger.warning("WebSocket connection closed")
-                    raise
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
-                    await asyncio.sleep(1)
+                    try:
+                        await self._handle_message_batch(batch)
+                    except Exception as e:
+                        logger.error(f"Error processing message: {e}")
+                        await asyncio.sleep(1)
+                
+                # Re-raise transport errors from the reader
+                await reader
+            finally:
+                reader.cancel()
+                if shutdown_watcher:
+                    shutdown_watcher.cancel()
+            
+            if not (self.shutdown_event and self.shutdown_event.is_set()):
+                raise ConnectionError("WebSocket connection closed by server")
     
-    async def _handle_message(self, data: dict):
-        """Process incoming WebSocket message"""
-        if "data" in data:
-            payload = data["data"]
-        else:
-            payload = data
+    async def _read_frames(self, ws, queue: asyncio.Queue):
+        """Forward received frames to the queue, None marks the end of the connection"""
+        try:
+            async for msg in ws:
+                queue.put_nowait(msg)
+        finally:
+            queue.put_nowait(None)
+    
+    async def _close_on_shutdown(self, ws):
+        """Close the WebSocket once shutdown is requested"""
+        await self.shutdown_event.wait()
+        await ws.close()
+    
+    def _decode(self, msg: Union[str, bytes]) -> BookTicker:
+        """Decode a raw frame from either the raw or the combined stream shape"""
+        try:
+            return self._ticker_decoder.decode(msg)
+        except msgspec.ValidationError:
+            return self._combined_decoder.decode(msg).data
+    
+    async def _handle_message_batch(self, msgs: List[Union[str, bytes]]):
+        """Fold a batch of frames into state and notify once with the updated symbols"""
+        updated_symbols: Set[str] = set()
         
-        symbol = payload["s"]
-        bid = float(payload["b"])
-        ask = float(payload["a"])
-
-        self.state.update_price(symbol, bid, ask)
-        logger.debug(f"{symbol} | Bid: {bid} | Ask: {ask}")
+        for msg in msgs:
+            try:
+                payload = self._decode(msg)
+            except msgspec.ValidationError:
+                self._handle_control_message(msg)
+                continue
+            except msgspec.DecodeError as e:
+                # Malformed frame: drop it alone, the rest of the batch still applies
+                logger.warning("Skipping malformed frame: %s", e)
+                continue
+            
+            if payload.s not in self._symbols_upper:
+                continue
+            
+            self.state.update_price(payload.s, payload.b, payload.a)
+            updated_symbols.add(payload.s)
+            logger.debug("%s | Bid: %s | Ask: %s", payload.s, payload.b, payload.a)
         
-        if self.on_update_callback:
-            await self.on_update_callback(symbol, bid, ask)
\ No newline at end of file
+        if updated_symbols and self.on_update_callback:
+            await self.on_update_callback(updated_symbols)
+    
+    def _handle_control_message(self, msg: Union[str, bytes]):
+        """Handle non-ticker frames such as subscription responses"""
+        message = msgspec.json.decode(msg)
+        if isinstance(message, dict) and message.get("error"):
+            logger.error(f"Subscription failed: {message['error']}")
+        elif isinstance(message, dict) and "result" in message:
+            logger.info(f"Subscription successful: {message}")
+        else:
+            logger.warning(f"Unknown message format: {message}")
@@ -1,32 +1,42 @@
 from typing import Dict, Optional
 
+import numpy as np
+
 import settings
 
 
 class MarketDataState:
     """Stores latest bid/ask prices for symbols"""
-    
+
     def __init__(self):
-        self.prices: Dict[str, Dict] = {}
-        for symbol in settings.PRICE_SYMBOLS:
-            self.prices[symbol.upper()] = {'bid': None, 'ask': None}
-    
+        # Symbol -> row in price_array, NaN marks a missing price. The array is updated
+        # in place, so readers may keep references to it and its rows
+        self.symbol_to_idx: Dict[str, int] = {
+            symbol.upper(): i for i, symbol in enumerate(settings.PRICE_SYMBOLS)
+        }
+        # One (bid, ask) row per symbol, bids and asks are column views onto it
+        self.price_array = np.full((len(self.symbol_to_idx), 2), np.nan)
+        self.bids = self.price_array[:, 0]
+        self.asks = self.price_array[:, 1]
+
     def update_price(self, symbol: str, bid: float, ask: float) -> None:
         """Update latest bid/ask for a symbol"""
-        if symbol in self.prices:
-            self.prices[symbol] = {
-                'bid': bid,
-                'ask': ask
-            }
-    
+        i = self.symbol_to_idx.get(symbol)
+        if i is not None:
+            self.price_array[i] = (bid, ask)
+
     def get_price(self, symbol: str) -> Optional[Dict]:
         """Get latest price data for a symbol"""
-        return self.prices.get(symbol)
-    
+        i = self.symbol_to_idx.get(symbol)
+        if i is None:
+            return None
+        bid, ask = self.price_array[i].tolist()
+        return {'bid': bid, 'ask': ask}
+
     def has_data(self, symbols: list) -> bool:
         """Check if all symbols have price data"""
-        for symbol in symbols:
-            price_data = self.prices.get(symbol)
-            if not price_data or price_data['bid'] is None or price_data['ask'] is None:
-                return False
-        return True
\ No newline at end of file
+        try:
+            idxs = [self.symbol_to_idx[symbol] for symbol in symbols]
+        except KeyError:
+            return False
+        return bool(np.isfinite(self.price_array[idxs]).all())
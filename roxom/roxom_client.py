@@ -1,65 +1,71 @@
-import json
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
+import httpx
+import orjson
 
 
 class RoxomClient:
-    """REST client for Roxom exchange API"""
+    """Async REST client for Roxom exchange API"""
     
     def __init__(self, api_key: str, base_url: str = "https://api.roxom.io"):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-KEY": api_key,
-            "Accept": "*/*",
-            "Content-Type": "application/json"
-        })
-    
-    def __enter__(self):
-        """Context manager entry"""
+        # Endpoints are absolute paths, so URLs are built by plain concatenation
+        self._base = base_url.rstrip('/')
+        # One pooled HTTP/2 client shared by every request, a handful of long-lived
+        # connections is enough since concurrent requests multiplex over HTTP/2
+        self.http_client = httpx.AsyncClient(
+            headers={
+                "X-API-KEY": api_key,
+                "Accept": "*/*",
+                "Content-Type": "application/json"
+            },
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60),
+            timeout=httpx.Timeout(5.0, connect=2.0)
+        )
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
         return self
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - properly close session"""
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - properly close the HTTP client"""
+        await self.close()
     
-    def close(self):
-        """Close the requests session"""
-        if hasattr(self, 'session') and self.session:
-            self.session.close()
+    async def close(self):
+        """Close the HTTP client and its pooled connections"""
+        if hasattr(self, 'http_client') and self.http_client:
+            await self.http_client.aclose()
     
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None) -> Dict[str, Any]:
+    async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
+                            data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make HTTP request to Roxom API"""
-        url = urljoin(self.base_url, endpoint)
+        url = f"{self._base}{endpoint}"
+        
+        if method.upper() not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=params)
-            elif method.upper() == "POST":
-                response = self.session.post(url, params=params, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
+            response = await self.http_client.request(method.upper(), url, params=params, json=data)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"Roxom API request failed: {e}"
-            if hasattr(e, 'response') and e.response is not None:
+            error_response = getattr(e, 'response', None)
+            if error_response is not None:
                 try:
-                    error_detail = e.response.json()
+                    error_detail = orjson.loads(error_response.content)
                     error_msg += f" | Response: {error_detail}"
-                except:
-                    error_msg += f" | Response text: {e.response.text}"
+                except orjson.JSONDecodeError:
+                    error_msg += f" | Response text: {error_response.text}"
             raise Exception(error_msg)
     
     # ===== TRADING METHODS =====
     
-    def place_order(self, symbol: str, side: str, qty: str, price: str, 
+    async def place_order(self, symbol: str, side: str, qty: str, price: str, 
                    order_type: str, time_in_force: str, inst_type: str) -> Dict[str, Any]:
         """Place a new order on Roxom"""
         data = {
@@ -71,34 +77,58 @@ class RoxomClient:
             "px": price,
             "timeInForce": time_in_force
         }
-        return self._make_request("POST", "/api/v1/orders", data=data)
+        return await self._make_request("POST", "/api/v1/orders", data=data)
     
-    def cancel_order(self, order_id: str) -> Dict[str, Any]:
+    async def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """Cancel an order by ID"""
         endpoint = f"/api/v1/orders/{order_id}/cancel"
-        return self._make_request("POST", endpoint)
+        return await self._make_request("POST", endpoint)
+    
+    async def place_orders(self, quotes: Sequence[Tuple[str, str]], symbol: str, qty: str,
+                           order_type: str, time_in_force: str, inst_type: str) -> List[Dict[str, Any]]:
+        """
+        Place several orders on one instrument in one call
+        
+        Roxom has no batch order endpoint, so the requests are sent concurrently
+        over the shared connection. Raises on the first failed placement.
+        
+        Args:
+            quotes: (side, price) per order
+            symbol, qty, order_type, time_in_force, inst_type: Shared by every order
+        """
+        return list(await asyncio.gather(*(
+            self.place_order(symbol, side, qty, price, order_type, time_in_force, inst_type)
+            for side, price in quotes
+        )))
+    
+    async def cancel_orders(self, order_ids: List[str]) -> List[Any]:
+        """Cancel several orders concurrently, failures are returned as exceptions in order"""
+        return list(await asyncio.gather(
+            *(self.cancel_order(order_id) for order_id in order_ids),
+            return_exceptions=True
+        ))
     
-    def cancel_all_orders(self) -> Dict[str, Any]:
+    async def cancel_all_orders(self) -> Dict[str, Any]:
         """Cancel all open orders"""
-        return self._make_request("POST", "/api/v1/orders/cancel-all")
+        return await self._make_request("POST", "/api/v1/orders/cancel-all")
     
-    def get_orders(self, inst_type: str) -> Dict[str, Any]:
+    async def get_orders(self, inst_type: str) -> Dict[str, Any]:
         """Get all orders"""
         params = {"instType": inst_type}
-        return self._make_request("GET", "/api/v1/orders", params=params)
+        return await self._make_request("GET", "/api/v1/orders", params=params)
     
     # ===== ACCOUNT & POSITION METHODS =====
     
-    def get_positions(self, symbol: str, inst_type: str) -> Dict[str, Any]:
+    async def get_positions(self, symbol: str, inst_type: str) -> Dict[str, Any]:
         """Get positions for a symbol"""
         params = {
             "instType": inst_type,
             "symbol": symbol
         }
-        return self._make_request("GET", "/api/v1/positions", params=params)
+        return await self._make_request("GET", "/api/v1/positions", params=params)
     
     # ===== MARKET DATA METHODS =====
     
-    def ping(self) -> Dict[str, Any]:
+    async def ping(self) -> Dict[str, Any]:
         """Ping the exchange"""
-        return self._make_request("GET", "/ping")
\ No newline at end of file
+        return await self._make_request("GET", "/ping")
\ No newline at end of file
@@ -1,8 +1,9 @@
 import asyncio
-import json
 import time
-from typing import Callable, Optional
+from datetime import datetime
+from typing import Callable, List, Optional, Union
 
+import orjson
 import websockets
 
 import settings
@@ -19,6 +20,8 @@ class RoxomWebSocketClient:
                  on_order_update: Optional[Callable] = None, 
                  shutdown_event: Optional[asyncio.Event] = None):
         self.api_key = api_key
+        # Only the timestamp changes between connection attempts
+        self._base_headers = {'X-API-KEY': api_key}
         self.account_state = account_state
         self.on_order_update = on_order_update
         self.shutdown_event = shutdown_event
@@ -30,34 +33,38 @@ class RoxomWebSocketClient:
         # Connection tracking
         self.connection_id = None
         self.is_authenticated = False
-        self.websocket = None    
+        self.websocket = None
+        
+        # Order updates are queued by the reader and applied in batches
+        self.order_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
     
     async def start(self):
         """Start the WebSocket connection with reconnection logic"""
+        consumer = asyncio.create_task(self._consume_order_updates())
         
-        while not (self.shutdown_event and self.shutdown_event.is_set()):
-            try:
-                await self._connect_and_listen()
-            except Exception as e:
-                if self.shutdown_event and self.shutdown_event.is_set():
-                    logger.info("Shutdown requested, stopping Roxom WebSocket client")
-                    break
-                logger.error(f"Roxom WebSocket connection error: {e}. Reconnecting in {self.reconnect_interval} seconds")
-                await asyncio.sleep(self.reconnect_interval)
+        try:
+            while not (self.shutdown_event and self.shutdown_event.is_set()):
+                try:
+                    await self._connect_and_listen()
+                except Exception as e:
+                    if self.shutdown_event and self.shutdown_event.is_set():
+                        logger.info("Shutdown requested, stopping Roxom WebSocket client")
+                        break
+                    logger.error(f"Roxom WebSocket connection error: {e}. Reconnecting in {self.reconnect_interval} seconds")
+                    await asyncio.sleep(self.reconnect_interval)
+        finally:
+            consumer.cancel()
     
     async def _connect_and_listen(self):
         """Connect to Roxom WebSocket with authentication and listen for updates"""
         # Generate timestamp for authentication
-        timestamp = str(int(time.time() * 1000))  # Milliseconds
+        timestamp = str(time.time_ns() // 1_000_000)  # Milliseconds
         
         # Prepare authentication headers
-        headers = {
-            'X-API-KEY': self.api_key,
-            'X-API-TIMESTAMP': timestamp
-        }
+        headers = {**self._base_headers, 'X-API-TIMESTAMP': timestamp}
         
         logger.info(f"Connecting to Roxom WebSocket: {self.ws_url}")
-        logger.debug(f"Authentication timestamp: {timestamp}")
+        logger.debug("Authentication timestamp: %s", timestamp)
         
         try:
             # Connect with authentication headers
@@ -66,27 +73,39 @@ class RoxomWebSocketClient:
                 additional_headers=headers,
                 ping_interval=None,
                 ping_timeout=None,
-                close_timeout=10
+                close_timeout=10,
+                max_size=2 ** 20
             ) as ws:
                 self.websocket = ws
                 logger.info("Connected to Roxom WebSocket")
                 self.is_authenticated = True
                 
-                while not (self.shutdown_event and self.shutdown_event.is_set()):
-                    try:
-                        msg = await asyncio.wait_for(ws.recv(), timeout=1.0)
-                        await self._handle_message(msg)
-                        
-                    except asyncio.TimeoutError:
-                        continue
-                    except websockets.ConnectionClosed:
-                        logger.warning("Roxom WebSocket connection closed")
-                        self.is_authenticated = False
-                        self.websocket = None
-                        raise
-                    except Exception as e:
-                        logger.error(f"Error processing Roxom WebSocket message: {e}")
-                        await asyncio.sleep(1)
+                # Closing the socket on shutdown wakes the pending recv below
+                shutdown_watcher = None
+                if self.shutdown_event:
+                    shutdown_watcher = asyncio.create_task(self._close_on_shutdown(ws))
+                
+                try:
+                    while True:
+                        try:
+                            # decode=False hands text frames over as raw bytes, skipping the
+                            # UTF-8 decode that orjson would repeat while parsing
+                            msg = await ws.recv(decode=False)
+                            await self._handle_message(msg)
+                            
+                        except websockets.ConnectionClosed:
+                            if self.shutdown_event and self.shutdown_event.is_set():
+                                break
+                            logger.warning("Roxom WebSocket connection closed")
+                            self.is_authenticated = False
+                            self.websocket = None
+                            raise
+                        except Exception as e:
+                            logger.error(f"Error processing Roxom WebSocket message: {e}")
+                            await asyncio.sleep(1)
+                finally:
+                    if shutdown_watcher:
+                        shutdown_watcher.cancel()
                         
         except websockets.InvalidHandshake as e:
             logger.error(f"WebSocket handshake failed (likely authentication issue): {e}")
@@ -104,19 +123,24 @@ class RoxomWebSocketClient:
             self.websocket = None
             raise
     
-    async def _handle_message(self, raw_message: str):
+    async def _close_on_shutdown(self, ws):
+        """Close the WebSocket once shutdown is requested"""
+        await self.shutdown_event.wait()
+        await ws.close()
+    
+    async def _handle_message(self, raw_message: Union[str, bytes]):
         """Process incoming WebSocket message"""
         try:
-            message = json.loads(raw_message)
+            message = orjson.loads(raw_message)
             
             if 'event' in message:
                 await self._handle_event_message(message)
             elif 'type' in message:
                 await self._handle_data_message(message)
             else:
-                logger.warning(f"Unknown message format: {message}")
+                logger.warning("Unknown message format: %s", message)
                 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse WebSocket message: {e} | Raw: {raw_message}")
         except Exception as e:
             logger.error(f"Error handling WebSocket message: {e}")
@@ -130,19 +154,19 @@ class RoxomWebSocketClient:
         
         if event == 'subscribe':
             if code == '0':
-                logger.info(f"Subscription successful: {message.get('arg', {})} | ConnId: {conn_id}")
+                logger.info("Subscription successful: %s | ConnId: %s", message.get('arg', {}), conn_id)
                 self.connection_id = conn_id
             else:
-                logger.error(f"Subscription failed: {msg_text} | Code: {code}")
+                logger.error("Subscription failed: %s | Code: %s", msg_text, code)
                 
         elif event == 'error':
             if code == '600010':
                 logger.error("Authentication failed - check API key and timestamp")
                 self.is_authenticated = False
             else:
-                logger.error(f"WebSocket error: {msg_text} | Code: {code}")
+                logger.error("WebSocket error: %s | Code: %s", msg_text, code)
         else:
-            logger.info(f"Event: {event} | Code: {code} | Message: {msg_text}")
+            logger.info("Event: %s | Code: %s | Message: %s", event, code, msg_text)
     
     async def _handle_data_message(self, message: dict):
         """Handle data messages (orders and balance)"""
@@ -150,23 +174,37 @@ class RoxomWebSocketClient:
         data = message.get('data', {})
         
         if msg_type == 'order':
-            await self._handle_order_update(data)
+            # Waits when the consumer falls behind rather than dropping updates
+            await self.order_queue.put(data)
         elif msg_type == 'balance':
             # Balance updates received but not currently used
-            logger.debug(f"Received balance update: {data}")
+            logger.debug("Received balance update: %s", data)
         else:
-            logger.warning(f"Unknown data message type: {msg_type}")
+            logger.warning("Unknown data message type: %s", msg_type)
     
-    async def _handle_order_update(self, order_data: dict):
-        """Handle order status updates"""
-        try:
-            self.account_state.update_order(order_data)
+    async def _consume_order_updates(self):
+        """Drain queued order updates and apply each burst as one batch"""
+        while True:
+            batch = [await self.order_queue.get()]
+            while not self.order_queue.empty():
+                batch.append(self.order_queue.get_nowait())
             
-            if self.on_order_update:
-                await self.on_order_update(order_data)
-                
-        except Exception as e:
-            logger.error(f"Error handling order update: {e}")
+            await self._handle_order_updates(batch)
+    
+    async def _handle_order_updates(self, batch: List[dict]):
+        """Apply a batch of order status updates and notify once"""
+        now_iso = datetime.utcnow().isoformat()
+        for order_data in batch:
+            try:
+                self.account_state.update_order(order_data, now_iso)
+            except Exception as e:
+                logger.error(f"Error handling order update: {e}")
+        
+        if self.on_order_update:
+            try:
+                await self.on_order_update(batch)
+            except Exception as e:
+                logger.error(f"Error handling order update: {e}")
     
     def close(self):
         """Close WebSocket connection"""
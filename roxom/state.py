@@ -1,130 +1,259 @@
+from collections import Counter, deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Set
 
 from logging_config import get_account_state_logger
 
 logger = get_account_state_logger()
 
+# Statuses after which an order can no longer trade
+_TERMINAL_STATES = frozenset({'filled', 'cancelled', 'rejected', 'inactive'})
+
+
+class OrderHistoryRecord(NamedTuple):
+    """One order status transition, field names follow the WebSocket payload"""
+    orderId: str
+    previousStatus: Optional[str]
+    newStatus: Optional[str]
+    executedQty: Optional[str]
+    remainingQty: Optional[str]
+    avgPx: Optional[str]
+    timestamp: Optional[str]
+    processedAt: str
+
+
+# ===== STATUS LOGGING =====
+
+def _log_submitted(order_data: Dict[str, Any], order_id: str) -> None:
+    logger.debug("Order submitted: %s", order_id)
+
+
+def _log_confirmed(order_data: Dict[str, Any], order_id: str) -> None:
+    logger.debug("Order confirmed: %s", order_id)
+
+
+def _log_filled(order_data: Dict[str, Any], order_id: str) -> None:
+    executed = order_data.get('executedQty', '0.00')
+    avg_price = order_data.get('avgPx', '0.00000000')
+    logger.info("Order filled %s @ %s [%s]", executed, avg_price, order_id)
+
+
+def _log_partially_filled(order_data: Dict[str, Any], order_id: str) -> None:
+    executed = order_data.get('executedQty', '0.00')
+    avg_price = order_data.get('avgPx', '0.00000000')
+    remaining = order_data.get('remainingQty', '0.00')
+    logger.info("Order partially filled %s @ %s | Remaining %s [%s]", executed, avg_price, remaining, order_id)
+
+
+def _log_cancelled(order_data: Dict[str, Any], order_id: str) -> None:
+    executed = order_data.get('executedQty', '0.00')
+    if executed != '0.00' and float(executed) > 0:
+        remaining = order_data.get('remainingQty', '0.00')
+        avg_price = order_data.get('avgPx', '0.00000000')
+        logger.info("Order cancelled with partial fill %s @ %s | Remaining %s [%s]",
+                    executed, avg_price, remaining, order_id)
+    else:
+        logger.debug("Order cancelled: %s", order_id)
+
+
+def _log_rejected(order_data: Dict[str, Any], order_id: str) -> None:
+    executed = order_data.get('executedQty', '0.00')
+    remaining = order_data.get('remainingQty', '0.00')
+    logger.info("Order rejected: %s | Executed %s | Remaining %s", order_id, executed, remaining)
+
+
+# Order status -> log function, statuses without an entry are not logged
+_STATUS_LOGGERS: Dict[str, Callable[[Dict[str, Any], str], None]] = {
+    'pendingsubmit': _log_submitted,
+    'submitted': _log_confirmed,
+    'filled': _log_filled,
+    'partiallyfilled': _log_partially_filled,
+    'cancelled': _log_cancelled,
+    'rejected': _log_rejected,
+}
+
 
 class AccountDataState:
     """Stores real-time account data from Roxom WebSocket: orders only"""
     
     def __init__(self):
-        # Order tracking - order_id -> order_data
-        self.orders: Dict[str, Dict[str, Any]] = {}
+        # Order tracking as parallel columns - order_id -> row index
+        self._id_to_idx: Dict[str, int] = {}
+        self._order_ids: List[str] = []
+        self._account_ids: List[Optional[str]] = []
+        self._symbols: List[Optional[str]] = []
+        self._status: List[Optional[str]] = []
+        self._remaining: List[Optional[str]] = []
+        self._executed: List[Optional[str]] = []
+        self._avg_px: List[Optional[str]] = []
+        self._timestamps: List[Optional[str]] = []
+        self._last_updated: List[Optional[str]] = []
         
-        # Track order status changes for debugging
-        self.order_history: List[Dict[str, Any]] = []
+        # IDs of orders not in a terminal state, kept in sync with _status
+        self.active_order_ids: Set[str] = set()
+        
+        # Track order status changes for debugging, oldest entries are evicted
+        self.order_history: Deque[OrderHistoryRecord] = deque(maxlen=1000)
+        
+        # Rolling view of the most recent fills for the dashboard
+        self._recent_fills: Deque[Dict[str, Any]] = deque(maxlen=10)
         
         logger.debug("AccountDataState initialized")
     
-    def update_order(self, order_data: Dict[str, Any]) -> None:
-        """Update order status from WebSocket order update"""
+    def update_order(self, order_data: Dict[str, Any], now_iso: Optional[str] = None) -> None:
+        """
+        Update order status from WebSocket order update
+        
+        Args:
+            order_data: Order fields in WebSocket format
+            now_iso: Processing time as ISO string, shared by callers applying a batch
+        """
         order_id = order_data.get('orderId')
         if not order_id:
             logger.warning("Received order update without orderId")
             return
         
-        previous_state = self.orders.get(order_id, {})
-        previous_status = previous_state.get('status', 'unknown')
+        if now_iso is None:
+            now_iso = datetime.utcnow().isoformat()
         
-        self.orders[order_id] = {
-            'orderId': order_id,
-            'accountId': order_data.get('accountId'),
-            'symbol': order_data.get('symbol'),
-            'status': order_data.get('status'),
-            'remainingQty': order_data.get('remainingQty'),
-            'executedQty': order_data.get('executedQty'),
-            'avgPx': order_data.get('avgPx'),
-            'timestamp': order_data.get('timestamp'),
-            'lastUpdated': datetime.utcnow().isoformat()
-        }
+        status = order_data.get('status')
+        self._write_row(
+            order_id,
+            order_data.get('accountId'),
+            order_data.get('symbol'),
+            status,
+            order_data.get('remainingQty'),
+            order_data.get('executedQty'),
+            order_data.get('avgPx'),
+            order_data.get('timestamp'),
+            now_iso
+        )
         
-        # Add to history for tracking
-        history_entry = {
-            'orderId': order_id,
-            'previousStatus': previous_status,
-            'newStatus': order_data.get('status'),
-            'executedQty': order_data.get('executedQty'),
-            'remainingQty': order_data.get('remainingQty'),
-            'avgPx': order_data.get('avgPx'),
-            'timestamp': order_data.get('timestamp'),
-            'processedAt': datetime.utcnow().isoformat()
-        }
-        self.order_history.append(history_entry)
+        # Log status changes in a uniform format
+        log_status = _STATUS_LOGGERS.get(status)
+        if log_status:
+            log_status(order_data, order_id)
+    
+    def record_placed(self, order_id: str, account_id: Optional[str], symbol: str,
+                      qty: str, now_iso: str) -> None:
+        """
+        Record an order just accepted by the REST API as pending submission
         
-        # Keep history manageable (last 1000 entries)
-        if len(self.order_history) > 1000:
-            self.order_history = self.order_history[-1000:]
+        Same effect as update_order with a pendingsubmit payload, without building one.
         
-        # Log status changes in a uniform format
-        status = order_data.get('status')
-        if status == 'pendingsubmit':
-            logger.debug(f"Order submitted: {order_id}")
-        elif status == 'submitted':
-            logger.debug(f"Order confirmed: {order_id}")
-        elif status == 'filled':
-            executed = order_data.get('executedQty', '0.00')
-            avg_price = order_data.get('avgPx', '0.00000000')
-            logger.info(f"Order filled {executed} @ {avg_price} [{order_id}]")
-        elif status == 'partiallyfilled':
-            executed = order_data.get('executedQty', '0.00')
-            avg_price = order_data.get('avgPx', '0.00000000')
-            remaining = order_data.get('remainingQty', '0.00')
-            logger.info(f"Order partially filled {executed} @ {avg_price} | Remaining {remaining} [{order_id}]")
-        elif status == 'cancelled':
-            executed = order_data.get('executedQty', '0.00')
-            if executed != '0.00' and float(executed) > 0:
-                remaining = order_data.get('remainingQty', '0.00')
-                avg_price = order_data.get('avgPx', '0.00000000')
-                logger.info(f"Order cancelled with partial fill {executed} @ {avg_price} | Remaining {remaining} [{order_id}]")
-            else:
-                logger.debug(f"Order cancelled: {order_id}")
-        elif status == 'rejected':
-            executed = order_data.get('executedQty', '0.00')
-            remaining = order_data.get('remainingQty', '0.00')
-            logger.info(f"Order rejected: {order_id} | Executed {executed} | Remaining {remaining}")
+        Args:
+            order_id: ID returned by the place order call
+            account_id: Account the order belongs to
+            symbol: Instrument symbol
+            qty: Order size, nothing is executed yet
+            now_iso: Processing time as ISO string, also used as the order timestamp
+        """
+        self._write_row(order_id, account_id, symbol, 'pendingsubmit', qty, '0.00', '0.00000000', now_iso, now_iso)
+        logger.debug("Order submitted: %s", order_id)
+    
+    def _write_row(self, order_id: str, account_id: Optional[str], symbol: Optional[str],
+                   status: Optional[str], remaining: Optional[str], executed: Optional[str],
+                   avg_px: Optional[str], timestamp: Optional[str], now_iso: str) -> None:
+        """Write an order's fields to its row and update active, fill and history bookkeeping"""
+        idx = self._id_to_idx.get(order_id)
+        if idx is None:
+            previous_status = 'unknown'
+            idx = self._append_row(order_id)
+        else:
+            previous_status = self._status[idx]
+        
+        self._account_ids[idx] = account_id
+        self._symbols[idx] = symbol
+        self._status[idx] = status
+        self._remaining[idx] = remaining
+        self._executed[idx] = executed
+        self._avg_px[idx] = avg_px
+        self._timestamps[idx] = timestamp
+        self._last_updated[idx] = now_iso
+        self._track_active(order_id, status)
+        
+        if status == 'filled' and previous_status != 'filled':
+            self._recent_fills.append(self._row_to_dict(idx))
+        
+        # Add to history for tracking
+        self.order_history.append(OrderHistoryRecord(
+            order_id, previous_status, status, executed, remaining, avg_px, timestamp, now_iso
+        ))
+    
+    def _track_active(self, order_id: str, status: Optional[str]) -> None:
+        """Keep active_order_ids in step with an order's status"""
+        if status in _TERMINAL_STATES:
+            self.active_order_ids.discard(order_id)
+        else:
+            self.active_order_ids.add(order_id)
+    
+    def _append_row(self, order_id: str) -> int:
+        """Allocate a row for a new order and return its index"""
+        idx = len(self._order_ids)
+        self._id_to_idx[order_id] = idx
+        self._order_ids.append(order_id)
+        for column in (self._account_ids, self._symbols, self._status, self._remaining,
+                       self._executed, self._avg_px, self._timestamps, self._last_updated):
+            column.append(None)
+        return idx
+    
+    def _row_to_dict(self, idx: int) -> Dict[str, Any]:
+        """Build the order dict for a row"""
+        return {
+            'orderId': self._order_ids[idx],
+            'accountId': self._account_ids[idx],
+            'symbol': self._symbols[idx],
+            'status': self._status[idx],
+            'remainingQty': self._remaining[idx],
+            'executedQty': self._executed[idx],
+            'avgPx': self._avg_px[idx],
+            'timestamp': self._timestamps[idx],
+            'lastUpdated': self._last_updated[idx]
+        }
     
     def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
-        """Get order data by ID"""
-        return self.orders.get(order_id)
+        """Get a copy of the order data by ID"""
+        idx = self._id_to_idx.get(order_id)
+        return self._row_to_dict(idx) if idx is not None else None
     
     def get_order_status(self, order_id: str) -> Optional[str]:
         """Get order status by ID"""
-        order = self.orders.get(order_id)
-        return order.get('status') if order else None
+        idx = self._id_to_idx.get(order_id)
+        return self._status[idx] if idx is not None else None
+    
+    def set_order_status(self, order_id: str, status: str) -> None:
+        """Overwrite the local status of a known order"""
+        idx = self._id_to_idx.get(order_id)
+        if idx is not None:
+            self._status[idx] = status
+            self._track_active(order_id, status)
     
     def get_active_orders(self) -> Dict[str, Dict[str, Any]]:
         """Get all orders that are not in terminal states"""
-        terminal_states = {'filled', 'cancelled', 'rejected', 'inactive'}
-        return {
-            order_id: order_data 
-            for order_id, order_data in self.orders.items() 
-            if order_data.get('status') not in terminal_states
-        }
+        # Row order is insertion order, so sorting keeps the result stable between calls
+        rows = sorted(self._id_to_idx[order_id] for order_id in self.active_order_ids)
+        return {self._order_ids[idx]: self._row_to_dict(idx) for idx in rows}
     
     def get_filled_orders(self) -> Dict[str, Dict[str, Any]]:
         """Get all filled orders"""
         return {
-            order_id: order_data 
-            for order_id, order_data in self.orders.items() 
-            if order_data.get('status') == 'filled'
+            self._order_ids[idx]: self._row_to_dict(idx)
+            for idx, status in enumerate(self._status)
+            if status == 'filled'
         }
     
+    def get_filled_count(self) -> int:
+        """Count filled orders without building their dicts"""
+        return self._status.count('filled')
+    
+    def get_recent_fills(self) -> List[Dict[str, Any]]:
+        """Get the most recently filled orders, oldest first"""
+        return list(self._recent_fills)
+    
     def is_order_active(self, order_id: str) -> bool:
         """Check if an order is still active (not in terminal state)"""
-        order = self.orders.get(order_id)
-        if not order:
-            return False
-        
-        terminal_states = {'filled', 'cancelled', 'rejected', 'inactive'}
-        return order.get('status') not in terminal_states
+        return order_id in self.active_order_ids
     
     def get_order_summary(self) -> Dict[str, int]:
         """Get summary of orders by status"""
-        summary = {}
-        for order_data in self.orders.values():
-            status = order_data.get('status', 'unknown')
-            summary[status] = summary.get(status, 0) + 1
-        return summary
-    
\ No newline at end of file
+        return dict(Counter(status or 'unknown' for status in self._status))
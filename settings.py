@@ -22,6 +22,9 @@ TIME_IN_FORCE = "gtc"
 # ===== PRICE FEED CONFIGURATION =====
 BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
 PRICE_SYMBOLS = ["paxgusdt", "btcusdt"]
+BINANCE_PING_INTERVAL = 20      # Seconds between keepalive pings
+BINANCE_RECONNECT_MIN_DELAY = 0.5  # Initial reconnection backoff in seconds
+BINANCE_RECONNECT_MAX_DELAY = 5    # Backoff cap in seconds
 
 # ===== ROXOM WEBSOCKET CONFIGURATION =====
 ROXOM_WS_URL = "wss://ws.roxom.io/ws"
@@ -35,6 +38,7 @@ DASHBOARD_ENABLED = True
 DASHBOARD_HOST = "localhost"
 DASHBOARD_PORT = 8000
 DASHBOARD_AUTO_OPEN = True
+DASHBOARD_CACHE_TTL = 0.2       # Seconds an encoded API response is reused
 
 # ===== LOGGING CONFIGURATION =====
 LOG_LEVEL = "INFO"
@@ -2,8 +2,26 @@
 Trading strategy modules
 """
 
-from .market_maker import MarketMaker
-from .orders import OrderManager
-from .pricing import FairPriceCalculator
+from importlib import import_module
+
+# Exports resolve on first access so importing one submodule doesn't pull in the rest
+_EXPORTS = {
+    'MarketMaker': '.market_maker',
+    'OrderManager': '.orders',
+    'FairPriceCalculator': '.pricing',
+}
 
 __all__ = ['MarketMaker', 'OrderManager', 'FairPriceCalculator']
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,71 @@
+"""
+Fused fair-price and quote kernel, JIT-compiled with numba when it is installed
+"""
+
+from functools import partial
+from math import floor
+from typing import Callable, Tuple
+
+QuoteKernel = Callable[[float, float, float, float], Tuple[float, int, int]]
+
+# fastmath without 'nnan'/'ninf': the NaN check on the fair price must survive optimisation
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _compute_quotes(bid_scale: float, ask_scale: float,
+                    paxg_bid: float, paxg_ask: float, btc_bid: float, btc_ask: float) -> Tuple[float, int, int]:
+    """
+    Return (fair, bid_ticks, ask_ticks) with bid/ask rounded to the nearest tick
+    
+    bid_scale and ask_scale are (1 -/+ half spread) / tick, so each side is one
+    multiply-add on the fair price. A missing (NaN) input price propagates to a NaN
+    fair price with zero ticks.
+    """
+    # GOLD/BTC = PAXG/USDT ÷ BTC/USDT, the /2 of both midprices cancels out
+    fair = (paxg_bid + paxg_ask) / (btc_bid + btc_ask)
+    if fair != fair:
+        return fair, 0, 0
+    # Prices are positive, so adding 0.5 and flooring rounds to nearest without a sign branch
+    bid_ticks = floor(fair * bid_scale + 0.5)
+    ask_ticks = floor(fair * ask_scale + 0.5)
+    return fair, bid_ticks, ask_ticks
+
+
+# Ahead-of-time build from build_pricing_kernel.py, else numba's JIT, else plain Python
+try:
+    from ._pricing_kernel_aot import compute_quotes as _aot_compute_quotes
+except ImportError:
+    _aot_compute_quotes = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def make_kernel(bid_scale: float, ask_scale: float) -> QuoteKernel:
+    """
+    Build a quote kernel with the spread/tick scales bound
+    
+    Under numba the scales are frozen into the compiled code as constants, letting
+    LLVM fold them. The AOT build can't be specialized at runtime, so when it is
+    present the scales are bound with partial instead of paying JIT at startup.
+    """
+    if _aot_compute_quotes is not None:
+        return partial(_aot_compute_quotes, bid_scale, ask_scale)
+    
+    if numba is None:
+        return partial(_compute_quotes, bid_scale, ask_scale)
+    
+    # No signature, so this only compiles as part of the specialized kernel below
+    compute_quotes = numba.njit(fastmath=_FASTMATH)(_compute_quotes)
+    
+    # The explicit signature compiles the kernel here, during setup, not on the first market tick
+    @numba.njit(
+        numba.types.Tuple((numba.float64, numba.int64, numba.int64))(*([numba.float64] * 4)),
+        fastmath=_FASTMATH
+    )
+    def kernel(paxg_bid, paxg_ask, btc_bid, btc_ask):
+        return compute_quotes(bid_scale, ask_scale, paxg_bid, paxg_ask, btc_bid, btc_ask)
+    
+    return kernel
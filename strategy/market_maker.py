@@ -4,8 +4,9 @@ Market making strategy implementation
 
 import asyncio
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import settings
 from logging_config import get_main_logger
@@ -18,6 +19,22 @@ from .pricing import FairPriceCalculator
 
 logger = get_main_logger()
 
+# Bound once so each quote skips the format-spec parse and attribute lookup
+_PRICE_FMT = "{:.8f}".format
+
+
+@dataclass(slots=True)
+class CurrentQuotes:
+    """IDs of the bid and ask orders currently resting on the book"""
+    bid_id: Optional[str] = None
+    ask_id: Optional[str] = None
+
+
+class StateSnapshot(NamedTuple):
+    """Read-only copy of order and position state published for other readers"""
+    current_orders: Dict[str, Optional[str]]
+    current_position: Dict[str, Any]
+
 
 class MarketMaker:
     """Encapsulates all market making state and logic"""
@@ -28,57 +45,61 @@ class MarketMaker:
         self.roxom_client = RoxomClient(settings.API_KEY, settings.BASE_URL)
         
         self.account_state = AccountDataState()
-        self.order_manager = OrderManager(self.roxom_client, self.account_state)
+        self.order_manager = OrderManager(self.roxom_client, self.account_state, self._on_order_update)
         
-        self.current_orders = {
-            'bid_id': None,
-            'ask_id': None
-        }
+        self.current_orders = CurrentQuotes()
         
         self.shutdown_event = asyncio.Event()
         self.emergency_shutdown = asyncio.Event()
+        # Single task waiting on shutdown_event, created on first use inside the running loop
+        self._shutdown_task: Optional[asyncio.Task] = None
         
         self.start_time = time.time()
         
+        # Bumped whenever orders or position change so readers can drop stale views
+        self.state_version = 0
+        
         self.current_position = {
             "symbol": settings.SYMBOL,
             "position": 0.0,
             "total_fills": 0,
             "last_updated": None
         }
+        
+        self.snapshot = StateSnapshot(asdict(self.current_orders), dict(self.current_position))
 
     async def quote_market(self):
         """Place bid and ask orders around fair price"""
         try:
-            fair_price = self.pricing_calculator.get_fair_price()
-            if not fair_price:
+            quote_ticks = self.pricing_calculator.get_quote_ticks()
+            if quote_ticks is None or not quote_ticks[0]:
                 logger.info("No fair price available, skipping quote")
                 return
             
-            bid_price, ask_price = self.pricing_calculator.calculate_bid_ask_prices(fair_price)
+            # Prices stay in integer ticks until formatted for the order payload
+            fair_price, bid_ticks, ask_ticks = quote_ticks
+            bid_px = _PRICE_FMT(bid_ticks * settings.TICK_SIZE)
+            ask_px = _PRICE_FMT(ask_ticks * settings.TICK_SIZE)
             
             # Cancel existing orders by ID
             orders_to_cancel = []
-            for order_type, order_id in self.current_orders.items():
+            for order_type, order_id in (('bid', self.current_orders.bid_id),
+                                         ('ask', self.current_orders.ask_id)):
                 if order_id:
                     # Check if order is still active before trying to cancel
                     if not self.account_state.is_order_active(order_id):
-                        logger.debug(f"Skipping cancellation of {order_type}: {order_id} (already {self.account_state.get_order_status(order_id)})")
+                        logger.debug("Skipping cancellation of %s: %s (already %s)",
+                                     order_type, order_id, self.account_state.get_order_status(order_id))
                         continue
                     orders_to_cancel.append((order_type, order_id))
             
             if orders_to_cancel:
                 # Log all cancellations
-                order_info = ", ".join([f"{order_id}" for _, order_id in orders_to_cancel])
-                logger.info(f"Canceling orders [{order_info}]")
+                logger.info("Canceling orders [%s]", ", ".join(order_id for _, order_id in orders_to_cancel))
                 
-                # Cancel all orders concurrently
-                cancellation_tasks = [
-                    asyncio.to_thread(self.roxom_client.cancel_order, order_id)
-                    for _, order_id in orders_to_cancel
-                ]
-                
-                cancellation_results = await asyncio.gather(*cancellation_tasks, return_exceptions=True)
+                cancellation_results = await self.roxom_client.cancel_orders(
+                    [order_id for _, order_id in orders_to_cancel]
+                )
                 
                 # Process results and update local state
                 cancelled_count = 0
@@ -87,83 +108,51 @@ class MarketMaker:
                         logger.error(f"Failed to cancel {order_id}: {result}")
                     else:
                         # Update local state to reflect cancellation
-                        order = self.account_state.get_order(order_id)
-                        if order:
-                            order['status'] = 'cancelled'
+                        self.account_state.set_order_status(order_id, 'cancelled')
                         cancelled_count += 1
             else:
                 logger.debug("No existing orders to cancel")
             
-            # Place bid and ask orders concurrently
-            bid_task = asyncio.to_thread(
-                self.roxom_client.place_order,
-                symbol=settings.SYMBOL,
-                side="buy",
-                qty=settings.ORDER_SIZE,
-                price=f"{bid_price:.8f}",
-                order_type=settings.ORDER_TYPE,
-                time_in_force=settings.TIME_IN_FORCE,
-                inst_type=settings.INST_TYPE
-            )
-            
-            ask_task = asyncio.to_thread(
-                self.roxom_client.place_order,
+            # Place bid and ask orders in one call
+            bid_result, ask_result = await self.roxom_client.place_orders(
+                (("buy", bid_px), ("sell", ask_px)),
                 symbol=settings.SYMBOL,
-                side="sell",
                 qty=settings.ORDER_SIZE,
-                price=f"{ask_price:.8f}",
                 order_type=settings.ORDER_TYPE,
                 time_in_force=settings.TIME_IN_FORCE,
                 inst_type=settings.INST_TYPE
             )
-            
-            bid_result, ask_result = await asyncio.gather(bid_task, ask_task)
+            now_iso = datetime.utcnow().isoformat()
             
             bid_id = bid_result['data']['orderId']
-            self.current_orders['bid_id'] = bid_id
-            logger.info(f"BID placed {settings.ORDER_SIZE} @ {bid_price:.8f} [{bid_id}]")
+            self.current_orders.bid_id = bid_id
+            logger.info("BID placed %s @ %s [%s]", settings.ORDER_SIZE, bid_px, bid_id)
             
-            self.account_state.update_order({
-                'orderId': bid_id,
-                'accountId': bid_result['data'].get('accountId'),
-                'symbol': settings.SYMBOL,
-                'status': 'pendingsubmit',
-                'remainingQty': settings.ORDER_SIZE,
-                'executedQty': '0.00',
-                'timestamp': datetime.utcnow().isoformat()
-            })
+            self.account_state.record_placed(
+                bid_id, bid_result['data'].get('accountId'), settings.SYMBOL, settings.ORDER_SIZE, now_iso
+            )
             
             ask_id = ask_result['data']['orderId']
-            self.current_orders['ask_id'] = ask_id
-            logger.info(f"ASK placed {settings.ORDER_SIZE} @ {ask_price:.8f} [{ask_id}]")
-            
-            self.account_state.update_order({
-                'orderId': ask_id,
-                'accountId': ask_result['data'].get('accountId'),
-                'symbol': settings.SYMBOL,
-                'status': 'pendingsubmit',
-                'remainingQty': settings.ORDER_SIZE,
-                'executedQty': '0.00',
-                'avgPx': '0.00000000',
-                'timestamp': datetime.utcnow().isoformat()
-            })
+            self.current_orders.ask_id = ask_id
+            logger.info("ASK placed %s @ %s [%s]", settings.ORDER_SIZE, ask_px, ask_id)
             
-
+            self.account_state.record_placed(
+                ask_id, ask_result['data'].get('accountId'), settings.SYMBOL, settings.ORDER_SIZE, now_iso
+            )
             
         except Exception as e:
             logger.error(f"Error quoting market: {e}")
+        finally:
+            self.notify_state_dirty()
 
     async def position_polling_loop(self):
         """Poll positions"""
         
         while not self.shutdown_event.is_set():
             try:
-                await self._update_position()                
-                try:
-                    await asyncio.wait_for(self.shutdown_event.wait(), timeout=1.0)
+                await self._update_position()
+                if await self._wait_for_shutdown(1.0):
                     break
-                except asyncio.TimeoutError:
-                    continue
                     
             except Exception as e:
                 logger.error(f"Error in position polling: {e}")
@@ -172,11 +161,11 @@ class MarketMaker:
     async def _update_position(self):
         """Fetch current position from REST API"""
         try:
-            response = self.roxom_client.get_positions(settings.SYMBOL, settings.INST_TYPE)
+            response = await self.roxom_client.get_positions(settings.SYMBOL, settings.INST_TYPE)
             positions = response.get('data', {}).get('positions', [])
             
             total_position = 0.0
-            filled_orders = len(self.account_state.get_filled_orders())
+            filled_orders = self.account_state.get_filled_count()
             
             for position in positions:
                 side = position.get('side')
@@ -188,11 +177,17 @@ class MarketMaker:
                 elif side == 'short':
                     total_position -= size
             
+            changed = (total_position != self.current_position["position"]
+                       or filled_orders != self.current_position["total_fills"])
+            
             self.current_position.update({
                 "position": total_position,
                 "total_fills": filled_orders,
                 "last_updated": datetime.utcnow().isoformat()
             })
+            
+            if changed:
+                self.notify_state_dirty()
                 
         except Exception as e:
             logger.warning(f"Failed to update position: {e}")
@@ -202,43 +197,56 @@ class MarketMaker:
         while not self.shutdown_event.is_set():
             await self.quote_market()
             
-            try:
-                await asyncio.wait_for(self.shutdown_event.wait(), timeout=settings.QUOTE_INTERVAL)
+            if await self._wait_for_shutdown(settings.QUOTE_INTERVAL):
                 break
-            except asyncio.TimeoutError:
-                continue
+    
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds, returning True early if shutdown was requested"""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.ensure_future(self.shutdown_event.wait())
+        
+        done, _ = await asyncio.wait((self._shutdown_task,), timeout=timeout)
+        return bool(done)
 
     async def immediate_cleanup(self):
         """Immediate order cancelation on CTRL+C"""
         logger.info("Canceling all active orders")
         
         try:
-            response = self.roxom_client.cancel_all_orders()
+            response = await self.roxom_client.cancel_all_orders()
             
             if response.get('success'):
                 logger.info("Successfully sent cancel all orders request")
             
-            cancelled_count = len([order_id for order_id in self.current_orders.values() if order_id])
-            self.current_orders = {'bid_id': None, 'ask_id': None}
+            self.current_orders.bid_id = self.current_orders.ask_id = None
+            
+            for order_id in list(self.account_state.active_order_ids):
+                self.account_state.set_order_status(order_id, 'cancelled')
             
-            for order_id, order_data in self.account_state.orders.items():
-                if self.account_state.is_order_active(order_id):
-                    order_data['status'] = 'cancelled'
+            self.notify_state_dirty()
             
         except Exception as e:
             logger.error(f"Failed to cancel all orders: {e}")
             logger.warning("Unable to cancel orders - continuing with shutdown")
             
             # Clear local tracking regardless
-            self.current_orders = {'bid_id': None, 'ask_id': None}
+            self.current_orders.bid_id = self.current_orders.ask_id = None
+            self.notify_state_dirty()
 
     async def emergency_monitor(self):
         """Monitor for emergency shutdown and cancel orders immediately"""
         await self.emergency_shutdown.wait()
         await self.immediate_cleanup()
 
-    async def on_price_update(self, symbol: str, bid: float, ask: float):
-        fair_price = self.pricing_calculator.get_fair_price()
+    async def _on_order_update(self, order_updates: List[dict]):
+        """Handle a batch of order updates forwarded by the order manager"""
+        self.notify_state_dirty()
+
+    def notify_state_dirty(self):
+        """Mark order/position state as changed and publish a fresh snapshot"""
+        # Readers only ever see a complete snapshot swapped in by one assignment
+        self.snapshot = StateSnapshot(asdict(self.current_orders), dict(self.current_position))
+        self.state_version += 1
 
     async def initialize(self):
         """Initialize the market maker components"""
@@ -254,11 +262,11 @@ class MarketMaker:
         
         await self.initialize()
         
-        # Create WebSocket client for price feeds
+        # Create WebSocket client for price feeds, quotes read prices on their own schedule
         ws_client = BinanceWebSocketClient(
             self.market_state, 
-            self.on_price_update, 
-            self.shutdown_event
+            on_update_callback=None,
+            shutdown_event=self.shutdown_event
         )
         
         try:
@@ -276,11 +284,13 @@ class MarketMaker:
         except Exception as e:
             logger.error(f"Error in main loop: {e}")
         finally:
-            self.close()
+            await self.close()
 
-    def close(self):
+    async def close(self):
         """Clean up resources"""
-        self.roxom_client.close()
+        if self._shutdown_task is not None:
+            self._shutdown_task.cancel()
+        await self.roxom_client.close()
 
     def trigger_shutdown(self):
         """Trigger shutdown for signal handling"""
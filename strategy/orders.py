@@ -1,5 +1,6 @@
 import asyncio
-from typing import Dict, Any, Optional
+import logging
+from typing import Any, Callable, Dict, List, Optional
 
 import settings
 from logging_config import get_order_manager_logger
@@ -13,9 +14,11 @@ logger = get_order_manager_logger()
 class OrderManager:
     """Manages order state: fetch via REST at start, update via WebSocket"""
     
-    def __init__(self, client: RoxomClient, state: AccountDataState):
+    def __init__(self, client: RoxomClient, state: AccountDataState,
+                 on_order_update: Optional[Callable] = None):
         self.client = client
         self.state = state
+        self.on_order_update = on_order_update
         self.ws_client = None
         self.is_initialized = False
 
@@ -25,7 +28,7 @@ class OrderManager:
     async def initialize(self) -> None:
         """Fetch existing orders via REST API"""
         try:
-            response = self.client.get_orders(settings.INST_TYPE)
+            response = await self.client.get_orders(settings.INST_TYPE)
             orders = response.get('data', {}).get('orders', [])
             
             logger.debug(f"Found {len(orders)} existing orders")
@@ -62,11 +65,14 @@ class OrderManager:
         
         await self.ws_client.start()
     
-    async def _on_order_update(self, order_data: dict) -> None:
-        """Handle order updates from WebSocket"""
-        order_id = order_data.get('orderId')
-        status = order_data.get('status')
-        logger.debug(f"Order update: {order_id} -> {status}")
+    async def _on_order_update(self, order_updates: List[dict]) -> None:
+        """Handle a batch of order updates from WebSocket"""
+        if logger.isEnabledFor(logging.DEBUG):
+            for order_data in order_updates:
+                logger.debug("Order update: %s -> %s", order_data.get('orderId'), order_data.get('status'))
+        
+        if self.on_order_update:
+            await self.on_order_update(order_updates)
     
     def get_active_orders(self) -> Dict[str, Dict[str, Any]]:
         """Get active orders from state"""
@@ -1,42 +1,120 @@
-from typing import Optional
+from dataclasses import dataclass
+from math import nan
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 import settings
 from market_data.state import MarketDataState
+from ._pricing_kernel import make_kernel
+
+
+@dataclass(frozen=True, slots=True)
+class _Cfg:
+    """Pricing constants derived from settings, fixed for the process lifetime"""
+    symbols: Tuple[str, ...]
+    tick: float
+    # Spread and tick folded together: ticks = fair * scale
+    bid_scale: float
+    ask_scale: float
+
+
+def _load_config() -> _Cfg:
+    half_spread_factor = settings.SPREAD_BPS / 20000
+    inv_tick = 1 / settings.TICK_SIZE
+    return _Cfg(
+        symbols=tuple(symbol.upper() for symbol in settings.PRICE_SYMBOLS),
+        tick=settings.TICK_SIZE,
+        bid_scale=(1 - half_spread_factor) * inv_tick,
+        ask_scale=(1 + half_spread_factor) * inv_tick
+    )
+
+
+CFG = _load_config()
 
 
 class FairPriceCalculator:
     """Calculates fair prices for GOLD/BTC"""
     def __init__(self, state: MarketDataState):
         self.state = state
+        
+        # Slots and array references are stable for the state's lifetime, constants come from CFG
+        self._paxg_idx = state.symbol_to_idx['PAXGUSDT']
+        self._btc_idx = state.symbol_to_idx['BTCUSDT']
+        self._prices = state.price_array
+        self._bids = state.bids
+        self._asks = state.asks
+        self._quote_kernel = make_kernel(CFG.bid_scale, CFG.ask_scale)
+        
+        # Last kernel input (paxg bid/ask, btc bid/ask) and its (fair, bid_ticks, ask_ticks) result
+        self._last_key: Optional[Tuple[float, float, float, float]] = None
+        self._last_result: Optional[Tuple[float, int, int]] = None
+        
+        # (base, quote) symbol pairs -> their slot index arrays, for batched pricing
+        self._pair_slots: Dict[Tuple[Tuple[str, str], ...], Tuple[np.ndarray, np.ndarray]] = {}
+    
+    def get_fair_price(self) -> float:
+        """Calculate fair price using PAXG and BTC midprices, NaN without price data"""
+        quote_ticks = self.get_quote_ticks()
+        return quote_ticks[0] if quote_ticks is not None else nan
     
-    def get_fair_price(self) -> Optional[float]:
-        """Calculate fair price using PAXG and BTC midprices"""
-        symbols = [symbol.upper() for symbol in settings.PRICE_SYMBOLS]
-        if not self.state.has_data(symbols):
+    def get_quotes(self) -> Optional[Tuple[float, float, float]]:
+        """Calculate (fair, bid, ask) prices, None without price data"""
+        quote_ticks = self.get_quote_ticks()
+        if quote_ticks is None:
             return None
         
-        paxg_data = self.state.get_price('PAXGUSDT')
-        btc_data = self.state.get_price('BTCUSDT')
+        fair_price, bid_ticks, ask_ticks = quote_ticks
+        return fair_price, bid_ticks * CFG.tick, ask_ticks * CFG.tick
+    
+    def get_quote_ticks(self) -> Optional[Tuple[float, int, int]]:
+        """Calculate (fair, bid_ticks, ask_ticks) in one fused kernel call, None without price data"""
+        prices = self._prices
+        paxg_bid, paxg_ask = prices[self._paxg_idx].tolist()
+        btc_bid, btc_ask = prices[self._btc_idx].tolist()
+        # Also false for a missing (NaN) BTC ask, and keeps the kernel off a zero divisor
+        if not btc_ask > 0.0:
+            return None
+        key = (paxg_bid, paxg_ask, btc_bid, btc_ask)
         
-        paxg_mid = (paxg_data['bid'] + paxg_data['ask']) / 2
-        btc_mid = (btc_data['bid'] + btc_data['ask']) / 2
+        # Books often sit unchanged between quotes, reuse the previous result then
+        if key != self._last_key:
+            self._last_result = self._quote_kernel(*key)
+            self._last_key = key
         
-        # GOLD/BTC = PAXG/USDT ÷ BTC/USDT
-        fair_price = paxg_mid / btc_mid
-        return fair_price
+        # Any other missing price has propagated into a NaN fair price
+        result = self._last_result
+        return result if result[0] == result[0] else None
     
-    def calculate_bid_ask_prices(self, fair_price: float) -> tuple[float, float]:
-        """Calculate bid/ask prices from fair price with spread and tick size rounding"""
-        spread = fair_price * (settings.SPREAD_BPS / 10000)
-        bid_price = fair_price - spread / 2
-        ask_price = fair_price + spread / 2
+    def get_fair_prices_batch(self, pairs: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """
+        Calculate fair prices for several synthetic crosses in one vectorized pass
+        
+        Args:
+            pairs: (base, quote) symbols, each fair price is base midprice / quote midprice
         
-        # Round to tick size
-        bid_price = round(bid_price / settings.TICK_SIZE) * settings.TICK_SIZE
-        ask_price = round(ask_price / settings.TICK_SIZE) * settings.TICK_SIZE
+        Returns:
+            Fair prices in pair order, NaN where a price is missing
+        """
+        pairs = tuple(pairs)
+        slots = self._pair_slots.get(pairs)
+        if slots is None:
+            symbol_to_idx = self.state.symbol_to_idx
+            slots = (
+                np.array([symbol_to_idx[base.upper()] for base, _ in pairs], dtype=np.intp),
+                np.array([symbol_to_idx[quote.upper()] for _, quote in pairs], dtype=np.intp)
+            )
+            self._pair_slots[pairs] = slots
         
-        return bid_price, ask_price
+        base, quote = slots
+        bids, asks = self._bids, self._asks
+        num = bids[base] + asks[base]
+        den = bids[quote] + asks[quote]
+        # Same zero-book guard as the scalar path, NaN already propagates on its own
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(den > 0, num / den, np.nan)
     
     def is_ready(self) -> bool:
         """Check if we have valid price data for quoting"""
-        return self.get_fair_price() is not None
\ No newline at end of file
+        # A zero BTC book would make the fair price a division by zero
+        return bool(self.state.has_data(CFG.symbols) and self._asks[self._btc_idx] > 0.0)